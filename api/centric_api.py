@@ -1,6 +1,9 @@
 #!/usr/bin/env python3
 
 import argparse
+import asyncio
+import atexit
+import functools
 import json
 import os
 import sys
@@ -9,13 +12,36 @@ from datetime import datetime, timezone
 from configparser import ConfigParser
 from pathlib import Path
 from typing import Optional, Dict
-from urllib.error import HTTPError, URLError
-from urllib.request import Request, urlopen
+
+import requests
+from requests.adapters import HTTPAdapter
+
+try:
+    import orjson  # type: ignore
+except ModuleNotFoundError:
+    orjson = None  # type: ignore[assignment]
+
+try:
+    import aiohttp  # type: ignore
+except ModuleNotFoundError:
+    aiohttp = None  # type: ignore[assignment]
 
 try:  # Python 3.11+
     import tomllib  # type: ignore[attr-defined]
 except ModuleNotFoundError:  # Fallback if running on <3.11 with tomli installed
-    tomllib = None  # type: ignore[assignment]
+    try:
+        import tomli as tomllib  # type: ignore[no-redef]
+    except ModuleNotFoundError:
+        tomllib = None  # type: ignore[assignment]
+
+# Shared session so the token fetch, the main request, and the 401 retry reuse
+# one keep-alive connection instead of doing a fresh TCP + TLS handshake each.
+_SESSION = requests.Session()
+_adapter = HTTPAdapter(pool_connections=4, pool_maxsize=16)
+_SESSION.mount("https://", _adapter)
+_SESSION.mount("http://", _adapter)
+
+VALID_METHODS = frozenset({"GET", "POST", "PUT", "PATCH", "DELETE", "HEAD", "OPTIONS"})
 
 
 def read_file(path: str) -> str:
@@ -23,45 +49,44 @@ def read_file(path: str) -> str:
         return f.read()
 
 
-def load_centric_config(env_file: Path) -> dict:
+@functools.lru_cache(maxsize=8)
+def _load_config_cached(path: str, mtime: int) -> dict:
     cfg: dict = {}
-    if env_file.is_file():
-        parser = ConfigParser()
-        # Allow keys without explicit section by injecting a default
-        with open(env_file, "r", encoding="utf-8") as f:
-            content = f.read()
-        parser.read_string("""
+    parser = ConfigParser()
+    # Allow keys without explicit section by injecting a default
+    with open(path, "r", encoding="utf-8") as f:
+        content = f.read()
+    parser.read_string("""
 [DEFAULT]
 """ + content)
-        if parser.has_section("centric_api"):
-            sect = parser["centric_api"]
-            if sect.get("base_url"):
-                cfg["BASE_URL"] = sect.get("base_url")
-            if sect.get("username"):
-                cfg["USERNAME"] = sect.get("username")
-            if sect.get("password"):
-                cfg["PASSWORD"] = sect.get("password")
-            if sect.get("default_endpoint"):
-                cfg["DEFAULT_ENDPOINT"] = sect.get("default_endpoint")
+    if parser.has_section("centric_api"):
+        sect = parser["centric_api"]
+        if sect.get("base_url"):
+            cfg["BASE_URL"] = sect.get("base_url")
+        if sect.get("username"):
+            cfg["USERNAME"] = sect.get("username")
+        if sect.get("password"):
+            cfg["PASSWORD"] = sect.get("password")
+        if sect.get("default_endpoint"):
+            cfg["DEFAULT_ENDPOINT"] = sect.get("default_endpoint")
     return cfg
 
 
-def load_aliases(aliases_file: Path) -> Dict[str, str]:
+def load_centric_config(env_file: Path) -> dict:
+    try:
+        mtime = env_file.stat().st_mtime_ns
+    except OSError:
+        return {}
+    return _load_config_cached(str(env_file), mtime)
+
+
+@functools.lru_cache(maxsize=8)
+def _load_aliases_cached(path: str, mtime: int) -> Dict[str, str]:
     aliases: Dict[str, str] = {}
-    if not aliases_file.is_file():
-        return aliases
     if tomllib is None:
-        # Lazy import tomli if available
-        try:
-            import tomli  # type: ignore
-        except ModuleNotFoundError:
-            return aliases
-        else:
-            with open(aliases_file, "rb") as f:
-                data = tomli.load(f)  # type: ignore
-    else:
-        with open(aliases_file, "rb") as f:
-            data = tomllib.load(f)  # type: ignore
+        return aliases
+    with open(path, "rb") as f:
+        data = tomllib.load(f)  # type: ignore
     table = data.get("aliases") if isinstance(data, dict) else None
     if isinstance(table, dict):
         for k, v in table.items():
@@ -70,6 +95,31 @@ def load_aliases(aliases_file: Path) -> Dict[str, str]:
     return aliases
 
 
+def load_aliases(aliases_file: Path) -> Dict[str, str]:
+    try:
+        mtime = aliases_file.stat().st_mtime_ns
+    except OSError:
+        return {}
+    return _load_aliases_cached(str(aliases_file), mtime)
+
+
+@functools.lru_cache(maxsize=8)
+def _read_token_cached(path: str, mtime: int) -> str:
+    with open(path, "r", encoding="utf-8") as f:
+        return f.read().strip()
+
+
+def read_cached_token(token_file: Path) -> Optional[str]:
+    try:
+        mtime = token_file.stat().st_mtime_ns
+    except OSError:
+        return None
+    try:
+        return _read_token_cached(str(token_file), mtime)
+    except OSError:
+        return None
+
+
 def _redact_headers(headers: Dict[str, str]) -> Dict[str, str]:
     redacted: Dict[str, str] = {}
     for k, v in headers.items():
@@ -80,6 +130,11 @@ def _redact_headers(headers: Dict[str, str]) -> Dict[str, str]:
     return redacted
 
 
+@functools.lru_cache(maxsize=8)
+def _redacted_headers_json(items: tuple) -> str:
+    return json.dumps(_redact_headers(dict(items)))
+
+
 def _bytes_to_safe_text(data: Optional[bytes]) -> str:
     if data is None:
         return ""
@@ -89,42 +144,53 @@ def _bytes_to_safe_text(data: Optional[bytes]) -> str:
         return "base64:" + base64.b64encode(data).decode("ascii")
 
 
+@functools.lru_cache(maxsize=1)
+def _get_log_handle(path: str):
+    handle = open(path, "a", encoding="utf-8", buffering=1)
+    atexit.register(handle.close)
+    return handle
+
+
 def write_log(log_file: Path, *, phase: str, method: str, url: str, request_headers: Dict[str, str], request_body: Optional[bytes], response_status: Optional[int] = None, response_headers: Optional[Dict[str, str]] = None, response_body: Optional[bytes] = None, note: Optional[str] = None) -> None:
     try:
         timestamp = datetime.now(timezone.utc).isoformat(timespec="seconds")
-        with open(log_file, "a", encoding="utf-8") as f:
-            f.write(f"=== {timestamp} | {phase} ===\n")
-            f.write(f"Method: {method}\n")
-            f.write(f"URL: {url}\n")
-            if note:
-                f.write(f"Note: {note}\n")
-            f.write("Request-Headers: " + json.dumps(_redact_headers(request_headers)) + "\n")
-            if request_body is not None:
-                f.write("Request-Body: " + _bytes_to_safe_text(request_body) + "\n")
-            if response_status is not None:
-                f.write(f"Response-Status: {response_status}\n")
-            if response_headers is not None:
-                try:
-                    f.write("Response-Headers: " + json.dumps(dict(response_headers)) + "\n")
-                except Exception:
-                    f.write("Response-Headers: <unserializable>\n")
-            if response_body is not None:
-                f.write("Response-Body: " + _bytes_to_safe_text(response_body) + "\n")
-            f.write("\n")
+        parts = [f"=== {timestamp} | {phase} ===\n", f"Method: {method}\n", f"URL: {url}\n"]
+        if note:
+            parts.append(f"Note: {note}\n")
+        parts.append("Request-Headers: " + _redacted_headers_json(tuple(request_headers.items())) + "\n")
+        if request_body is not None:
+            parts.append("Request-Body: " + _bytes_to_safe_text(request_body) + "\n")
+        if response_status is not None:
+            parts.append(f"Response-Status: {response_status}\n")
+        if response_headers is not None:
+            try:
+                parts.append("Response-Headers: " + json.dumps(dict(response_headers)) + "\n")
+            except Exception:
+                parts.append("Response-Headers: <unserializable>\n")
+        if response_body is not None:
+            parts.append("Response-Body: " + _bytes_to_safe_text(response_body) + "\n")
+        parts.append("\n")
+        _get_log_handle(str(log_file)).write("".join(parts))
     except Exception:
         # Logging must never break the main flow
         pass
 
 
-def http_request_with_meta(url: str, method: str, headers: Dict[str, str], data: Optional[bytes] = None, timeout: float = 30.0):
-    req = Request(url=url, method=method.upper(), data=data)
-    for k, v in headers.items():
-        req.add_header(k, v)
-    if "User-Agent" not in headers:
-        req.add_header("User-Agent", "centric-api-client/1.0 (python-stdlib)")
-    with urlopen(req, timeout=timeout) as resp:
-        body = resp.read()
-        return resp.getcode(), dict(resp.headers.items()), body
+def http_request_with_meta(url: str, method: str, headers: Dict[str, str], data: Optional[bytes] = None, timeout: float = 30.0, stream_to: Optional[Path] = None):
+    send_headers = dict(headers)
+    if "User-Agent" not in send_headers:
+        send_headers["User-Agent"] = "centric-api-client/1.0 (python-requests)"
+    if stream_to is not None:
+        # Stream the body straight to disk, never holding it in memory
+        with _SESSION.request(method.upper(), url, headers=send_headers, data=data, timeout=timeout, stream=True) as resp:
+            resp.raise_for_status()
+            with open(stream_to, "wb") as f:
+                for chunk in resp.iter_content(chunk_size=1 << 16):
+                    f.write(chunk)
+            return resp.status_code, dict(resp.headers), None
+    resp = _SESSION.request(method.upper(), url, headers=send_headers, data=data, timeout=timeout)
+    resp.raise_for_status()
+    return resp.status_code, dict(resp.headers), resp.content
 
 
 def build_json_body(username: str, password: str) -> bytes:
@@ -133,13 +199,8 @@ def build_json_body(username: str, password: str) -> bytes:
 
 
 def http_request(url: str, method: str, headers: Dict[str, str], data: Optional[bytes] = None, timeout: float = 30.0) -> bytes:
-    req = Request(url=url, method=method.upper(), data=data)
-    for k, v in headers.items():
-        req.add_header(k, v)
-    if "User-Agent" not in headers:
-        req.add_header("User-Agent", "centric-api-client/1.0 (python-stdlib)")
-    with urlopen(req, timeout=timeout) as resp:
-        return resp.read()
+    _, _, body = http_request_with_meta(url, method, headers, data, timeout=timeout)
+    return body
 
 
 def get_token(base_url: str, username: str, password: str, timeout: float = 30.0) -> str:
@@ -161,6 +222,27 @@ def get_token(base_url: str, username: str, password: str, timeout: float = 30.0
     return token_value
 
 
+async def _fetch_one(session, alias: str, url: str):
+    # Catch failures per fetch so one dead endpoint cannot abort the whole
+    # gather and discard already-fetched responses; status None marks a
+    # connection-level failure and body carries the exception
+    try:
+        async with session.get(url) as resp:
+            body = await resp.read()
+            return alias, url, resp.status, body
+    except (aiohttp.ClientError, asyncio.TimeoutError, OSError) as exc:
+        return alias, url, None, exc
+
+
+async def _run_batch(pairs, token: str, timeout: float):
+    # One shared session so every endpoint reuses the same TLS connection pool
+    async with aiohttp.ClientSession(
+        headers={"Authorization": f"Bearer {token}", "Content-Type": "application/json"},
+        timeout=aiohttp.ClientTimeout(total=timeout),
+    ) as session:
+        return await asyncio.gather(*(_fetch_one(session, alias, url) for alias, url in pairs))
+
+
 def main() -> int:
     parser = argparse.ArgumentParser(description="Centric API helper (Python)")
     parser.add_argument("-b", "--base-url", dest="base_url")
@@ -175,6 +257,7 @@ def main() -> int:
     parser.add_argument("--env-file", dest="env_file", default=str(Path(__file__).parent / ".env"))
     parser.add_argument("--aliases-file", dest="aliases_file", default=str(Path(__file__).parent / "aliases.toml"), help="Path to TOML aliases file")
     parser.add_argument("--alias", dest="alias_name", help="Alias name to use (e.g., materials)")
+    parser.add_argument("--aliases", dest="aliases_csv", help="Comma-separated alias names to fetch concurrently, each written to <alias>.json")
     parser.add_argument("--log-file", dest="log_file", default=str(Path(__file__).parent / "centric_api.log"), help="Path to append request/response logs")
     parser.add_argument("--token", dest="token")
     parser.add_argument("--token-file", dest="token_file", default=str(Path(__file__).parent / ".token"), help="Path to token cache file")
@@ -183,8 +266,14 @@ def main() -> int:
     # Capture unknown args to allow alias style like `-materials`
     args, unknown = parser.parse_known_args()
 
+    # Resolve file paths once; the nested closures reuse them
+    log_path = Path(args.log_file)
+    env_path = Path(args.env_file)
+    aliases_path = Path(args.aliases_file)
+    token_file_path = Path(args.token_file)
+
     # Load from .env [centric_api]
-    cfg = load_centric_config(Path(args.env_file))
+    cfg = load_centric_config(env_path)
 
     # Environment variables override file defaults
     base_url = args.base_url or os.environ.get("BASE_URL") or cfg.get("BASE_URL")
@@ -193,19 +282,16 @@ def main() -> int:
     endpoint = args.endpoint or os.environ.get("DEFAULT_ENDPOINT") or cfg.get("DEFAULT_ENDPOINT")
 
     # Load aliases and resolve alias if provided
-    aliases = load_aliases(Path(args.aliases_file))
+    aliases = load_aliases(aliases_path)
     alias_flag: Optional[str] = None
     # 1) explicit --alias <name>
     if args.alias_name:
         alias_flag = args.alias_name.strip().lstrip("-")
     # 2) unknown long flag like --materials
     if not alias_flag:
-        for item in unknown:
-            if item.startswith("--") and len(item) > 2:
-                alias_flag = item.lstrip("-")
+        alias_flag = next((item.lstrip("-") for item in unknown if item.startswith("--") and len(item) > 2), None)
     # 3) rescue: if -materials was parsed as -m "aterials", reinterpret when it matches an alias
-    valid_methods = {"GET", "POST", "PUT", "PATCH", "DELETE", "HEAD", "OPTIONS"}
-    if not alias_flag and args.method and args.method.upper() not in valid_methods:
+    if not alias_flag and args.method and args.method.upper() not in VALID_METHODS:
         possible = args.method.strip().lstrip("-").lower()
         if possible in aliases:
             alias_flag = possible
@@ -213,12 +299,8 @@ def main() -> int:
 
     # Resolve token: explicit flag/env, cached file, or authenticate
     token: Optional[str] = args.token or os.environ.get("TOKEN")
-    token_file_path = Path(args.token_file)
-    if not token and token_file_path.is_file():
-        try:
-            token = token_file_path.read_text(encoding="utf-8").strip()
-        except OSError:
-            token = None
+    if not token:
+        token = read_cached_token(token_file_path)
 
     def authenticate_and_cache() -> str:
         nonlocal token
@@ -227,7 +309,7 @@ def main() -> int:
             raise SystemExit(1)
         try:
             token = get_token(base_url, username, password, timeout=args.timeout)
-        except (HTTPError, URLError, RuntimeError) as exc:
+        except (requests.RequestException, RuntimeError) as exc:
             print(f"Authentication failed: {exc}", file=sys.stderr)
             raise SystemExit(1)
         try:
@@ -247,6 +329,36 @@ def main() -> int:
         print(ensure_token())
         return 0
 
+    # Batch mode: fetch several aliases concurrently over one session
+    if args.aliases_csv:
+        if aiohttp is None:
+            print("Error: --aliases requires aiohttp (pip install aiohttp)", file=sys.stderr)
+            return 1
+        names = [n.strip().lstrip("-") for n in args.aliases_csv.split(",") if n.strip()]
+        unknown_names = [n for n in names if n not in aliases]
+        if unknown_names:
+            print(f"Error: unknown alias(es): {', '.join(unknown_names)}", file=sys.stderr)
+            return 1
+        pairs = [(n, aliases[n]) for n in names]
+        results = asyncio.run(_run_batch(pairs, ensure_token(), args.timeout))
+        # On any 401, re-authenticate once and retry just the failed URLs
+        retry_pairs = [(alias, url) for alias, url, status, _ in results if status == 401]
+        results = [r for r in results if r[2] != 401]
+        if retry_pairs:
+            results.extend(asyncio.run(_run_batch(retry_pairs, authenticate_and_cache(), args.timeout)))
+        failed = 0
+        for alias, url, status, body in results:
+            if status is None:
+                failed += 1
+                print(f"Request failed for {alias} ({url}): {body}", file=sys.stderr)
+            elif status < 400:
+                Path(f"{alias}.json").write_bytes(body)
+                print(f"Wrote {alias}.json")
+            else:
+                failed += 1
+                print(f"Request failed for {alias} ({url}): HTTP {status}", file=sys.stderr)
+        return 1 if failed else 0
+
     # Determine request URL
     req_url: Optional[str] = None
     if alias_flag:
@@ -277,44 +389,52 @@ def main() -> int:
             data_str = read_file(data_str[1:])
         data_bytes = data_str.encode("utf-8")
 
-    def perform_request_with_refresh() -> bytes:
+    out_file = args.out_file or "payload.json"
+    # With --raw the body goes straight to the output file without an
+    # intermediate bytes object
+    stream_target = Path(out_file) if (args.raw and out_file) else None
+
+    def perform_request_with_refresh() -> Optional[bytes]:
         try:
-            write_log(Path(args.log_file), phase="REQUEST", method=args.method, url=req_url, request_headers=headers, request_body=data_bytes)
-            status, resp_headers, body = http_request_with_meta(req_url, args.method, headers, data_bytes, timeout=args.timeout)
-            write_log(Path(args.log_file), phase="RESPONSE", method=args.method, url=req_url, request_headers=headers, request_body=data_bytes, response_status=status, response_headers=resp_headers, response_body=body)
+            write_log(log_path, phase="REQUEST", method=args.method, url=req_url, request_headers=headers, request_body=data_bytes)
+            status, resp_headers, body = http_request_with_meta(req_url, args.method, headers, data_bytes, timeout=args.timeout, stream_to=stream_target)
+            write_log(log_path, phase="RESPONSE", method=args.method, url=req_url, request_headers=headers, request_body=data_bytes, response_status=status, response_headers=resp_headers, response_body=body)
             return body
-        except HTTPError as exc:
-            if exc.code == 401:
+        except requests.HTTPError as exc:
+            if exc.response is not None and exc.response.status_code == 401:
                 # Force re-authenticate and retry once
                 new_token = authenticate_and_cache()
                 headers["Authorization"] = f"Bearer {new_token}"
-                # Log original failure
                 err_body = None
                 try:
-                    err_body = exc.read()
+                    err_body = exc.response.content
                 except Exception:
                     pass
-                write_log(Path(args.log_file), phase="ERROR", method=args.method, url=req_url, request_headers=headers, request_body=data_bytes, response_status=exc.code, response_body=err_body, note="401 -> retrying after re-auth")
-                # Retry
-                write_log(Path(args.log_file), phase="REQUEST", method=args.method, url=req_url, request_headers=headers, request_body=data_bytes, note="retry")
-                status, resp_headers, body = http_request_with_meta(req_url, args.method, headers, data_bytes, timeout=args.timeout)
-                write_log(Path(args.log_file), phase="RESPONSE", method=args.method, url=req_url, request_headers=headers, request_body=data_bytes, response_status=status, response_headers=resp_headers, response_body=body, note="retry")
+                # One record covers the original 401 and the retried request
+                write_log(log_path, phase="RETRY_401", method=args.method, url=req_url, request_headers=headers, request_body=data_bytes, response_status=exc.response.status_code, response_body=err_body, note="401 -> re-authenticated, retrying")
+                status, resp_headers, body = http_request_with_meta(req_url, args.method, headers, data_bytes, timeout=args.timeout, stream_to=stream_target)
+                write_log(log_path, phase="RESPONSE", method=args.method, url=req_url, request_headers=headers, request_body=data_bytes, response_status=status, response_headers=resp_headers, response_body=body, note="retry")
                 return body
             raise
-        except URLError as exc:
-            write_log(Path(args.log_file), phase="ERROR", method=args.method, url=req_url, request_headers=headers, request_body=data_bytes, note=f"URLError: {exc}")
+        except requests.RequestException as exc:
+            write_log(log_path, phase="ERROR", method=args.method, url=req_url, request_headers=headers, request_body=data_bytes, note=f"RequestException: {exc}")
             raise
 
     try:
         raw = perform_request_with_refresh()
-    except (HTTPError, URLError) as exc:
+    except requests.RequestException as exc:
         print(f"Request failed: {exc}", file=sys.stderr)
         return 1
 
-    out_file = args.out_file or "payload.json"
     if out_file:
         if args.raw:
-            Path(out_file).write_bytes(raw)
+            # Already streamed to disk by http_request_with_meta
+            pass
+        elif orjson is not None:
+            try:
+                Path(out_file).write_bytes(orjson.dumps(orjson.loads(raw), option=orjson.OPT_INDENT_2))
+            except orjson.JSONDecodeError:
+                Path(out_file).write_bytes(raw)
         else:
             try:
                 obj = json.loads(raw)
@@ -1,40 +1,70 @@
 #!/usr/bin/env python3
 
 import argparse
+import functools
 import json
+from datetime import date, datetime
 from pathlib import Path
 from typing import Any, Dict, Iterable, List, Tuple
 
 import pandas as pd
 
+try:
+    import orjson  # type: ignore
+except ModuleNotFoundError:
+    orjson = None  # type: ignore[assignment]
+
+try:
+    import xlsxwriter  # noqa: F401
+    # constant_memory is only safe when rows are written strictly in order,
+    # which df.to_excel does not do (it emits cells column-major) -- it is
+    # enabled per-workbook in write_excel_multi when every sheet is streamed
+    # row by row
+    # default_date_format gives datetimes written via write_row a date number
+    # format, matching how to_excel renders them
+    EXCEL_WRITER_KWARGS = {
+        "engine": "xlsxwriter",
+        "engine_kwargs": {"options": {"strings_to_urls": False, "default_date_format": "yyyy-mm-dd hh:mm:ss"}},
+    }
+except ModuleNotFoundError:
+    EXCEL_WRITER_KWARGS = {"engine": "openpyxl"}
+
 
 def read_json(path: Path) -> Any:
+    if orjson is not None:
+        return orjson.loads(path.read_bytes())
     with open(path, "r", encoding="utf-8") as f:
         return json.load(f)
 
 
 def find_arrays_of_objects(obj: Any, base_path: str = "$") -> List[Tuple[str, List[Dict[str, Any]]]]:
+    # Iterative DFS; an explicit stack avoids Python call overhead on deep payloads.
+    # Children are pushed in reverse so results keep the recursive pre-order.
     results: List[Tuple[str, List[Dict[str, Any]]]] = []
-    if isinstance(obj, list):
-        if obj and all(isinstance(x, dict) for x in obj):
-            results.append((base_path, obj))
-    elif isinstance(obj, dict):
-        for k, v in obj.items():
-            child_path = f"{base_path}.{k}"
-            results.extend(find_arrays_of_objects(v, child_path))
+    stack: List[Tuple[Any, str]] = [(obj, base_path)]
+    while stack:
+        cur, path = stack.pop()
+        if isinstance(cur, list):
+            if cur and all(type(x) is dict for x in cur):
+                results.append((path, cur))
+        elif isinstance(cur, dict):
+            stack.extend((v, f"{path}.{k}") for k, v in reversed(cur.items()))
     return results
 
 
+@functools.lru_cache(maxsize=64)
+def _compile_path(path: str) -> Tuple[str, ...]:
+    # simple dot path from root (with optional leading $.)
+    return tuple(p for p in path.replace("$.", "").split(".") if p)
+
+
 def get_by_path(obj: Any, path: str) -> Any:
     if not path or path == "$":
         return obj
-    # simple dot path from root (with optional leading $.)
-    parts = [p for p in path.replace("$.", "").split(".") if p]
     cur = obj
-    for p in parts:
-        if isinstance(cur, dict) and p in cur:
-            cur = cur[p]
-        else:
+    for p in _compile_path(path):
+        cur = cur.get(p) if isinstance(cur, dict) else None
+        if cur is None:
             return None
     return cur
 
@@ -42,21 +72,61 @@ def get_by_path(obj: Any, path: str) -> Any:
 def to_dataframe(records: List[Dict[str, Any]], sep: str) -> pd.DataFrame:
     if not records:
         return pd.DataFrame()
+    # Fast path: if a sample of records has no nested values, json_normalize
+    # would be a no-op and from_records is much faster
+    sample = records[:8]
+    if not any(isinstance(v, (dict, list)) for rec in sample for v in rec.values()):
+        return pd.DataFrame.from_records(records)
     return pd.json_normalize(records, sep=sep, max_level=None)
 
 
 def write_excel_single(df: pd.DataFrame, out_path: Path, sheet_name: str) -> None:
     out_path.parent.mkdir(parents=True, exist_ok=True)
-    with pd.ExcelWriter(out_path, engine="openpyxl") as writer:
+    with pd.ExcelWriter(out_path, **EXCEL_WRITER_KWARGS) as writer:
         df.to_excel(writer, index=False, sheet_name=sheet_name)
 
 
+# Above this row count, write sheets through xlsxwriter directly instead of
+# paying pandas' per-cell coercion in to_excel
+_RAW_WRITE_THRESHOLD = 10_000
+
+
+def _sheet_rows(df: pd.DataFrame) -> Iterable[Tuple[Any, ...]]:
+    # Coerce values to cell-writable scalars one column at a time; datetimes
+    # pass through so write_row keeps them as real Excel datetimes
+    cols = []
+    for name in df.columns:
+        cols.append([
+            None if v is None or v is pd.NaT or (isinstance(v, float) and v != v)
+            else v if isinstance(v, (bool, int, float, str, datetime, date))
+            else str(v)
+            for v in df[name].to_list()
+        ])
+    return zip(*cols)
+
+
 def write_excel_multi(sheets: List[Tuple[str, pd.DataFrame]], out_path: Path) -> None:
     out_path.parent.mkdir(parents=True, exist_ok=True)
-    with pd.ExcelWriter(out_path, engine="openpyxl") as writer:
+    writer_kwargs = EXCEL_WRITER_KWARGS
+    if EXCEL_WRITER_KWARGS["engine"] == "xlsxwriter" and sheets and all(len(df) > _RAW_WRITE_THRESHOLD for _, df in sheets):
+        # Every sheet takes the in-order write_row path, so the workbook can
+        # stream rows to disk with O(1) memory
+        writer_kwargs = {
+            "engine": "xlsxwriter",
+            "engine_kwargs": {"options": {"strings_to_urls": False, "default_date_format": "yyyy-mm-dd hh:mm:ss", "constant_memory": True}},
+        }
+    with pd.ExcelWriter(out_path, **writer_kwargs) as writer:
         for sheet_name, df in sheets:
             safe_name = sheet_name[-31:] if len(sheet_name) > 31 else sheet_name
-            df.to_excel(writer, index=False, sheet_name=safe_name or "data")
+            safe_name = safe_name or "data"
+            df = df.reset_index(drop=True)
+            if EXCEL_WRITER_KWARGS["engine"] == "xlsxwriter" and len(df) > _RAW_WRITE_THRESHOLD:
+                ws = writer.book.add_worksheet(safe_name)
+                ws.write_row(0, 0, [str(c) for c in df.columns])
+                for i, row in enumerate(_sheet_rows(df), 1):
+                    ws.write_row(i, 0, row)
+            else:
+                df.to_excel(writer, index=False, sheet_name=safe_name)
 
 
 def main() -> int:
@@ -1,9 +1,28 @@
 import sys
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from pathlib import Path
 from typing import Dict, List, Tuple
 
+import numpy as np
 import pandas as pd
 
+try:
+    import python_calamine  # noqa: F401  # Rust-backed xlsx parsing, much faster
+    EXCEL_ENGINE = "calamine"
+except ModuleNotFoundError:
+    EXCEL_ENGINE = "openpyxl"
+
+try:
+    import xlsxwriter  # noqa: F401
+    # Note: constant_memory cannot be used here because df.to_excel writes
+    # cells column-major and constant_memory drops out-of-order rows
+    EXCEL_WRITER_KWARGS = {
+        "engine": "xlsxwriter",
+        "engine_kwargs": {"options": {"strings_to_urls": False}},
+    }
+except ModuleNotFoundError:
+    EXCEL_WRITER_KWARGS = {"engine": "openpyxl"}
+
 
 def find_file_pairs(directory: Path) -> List[Tuple[Path, Path, str]]:
     """
@@ -36,9 +55,8 @@ def find_file_pairs(directory: Path) -> List[Tuple[Path, Path, str]]:
 
 
 def normalize_column_names(df: pd.DataFrame) -> pd.DataFrame:
-    df = df.copy()
-    df.columns = [str(c).strip() for c in df.columns]
-    return df
+    # rename returns a new frame without copying the data buffers
+    return df.rename(columns={c: str(c).strip() for c in df.columns})
 
 
 def get_column(df: pd.DataFrame, preferred_names: List[str], fallback_index: int) -> pd.Series:
@@ -57,32 +75,40 @@ def get_column(df: pd.DataFrame, preferred_names: List[str], fallback_index: int
     raise KeyError(f"Could not find any of {preferred_names} and no fallback column at index {fallback_index}.")
 
 
+def _clean_column(s: pd.Series) -> pd.Series:
+    """Stringify, strip, and blank out missing values in one vector pass."""
+    a = s.to_numpy(dtype=object, copy=False)
+    stripped = np.char.strip(a.astype(str))
+    out = np.where((stripped == "") | (stripped == "nan"), None, stripped)
+    return pd.Series(out, index=s.index)
+
+
 def read_orders(path: Path) -> pd.DataFrame:
-    df = pd.read_excel(path, dtype=str)
+    df = pd.read_excel(path, dtype=str, engine=EXCEL_ENGINE)
     df = normalize_column_names(df)
     purchase_order = get_column(df, ["purchase_order", "purchase order", "po"], 0)
     product = get_column(df, ["product", "product_code", "sku"], 1)
     base_url = get_column(df, ["base_url", "base url", "url"], 2)
     out = pd.DataFrame({
-        "purchase_order": purchase_order.astype(str).str.strip(),
-        "product": product.astype(str).str.strip(),
-        "base_url": base_url.astype(str).str.strip(),
+        "purchase_order": _clean_column(purchase_order),
+        "product": _clean_column(product),
+        "base_url": _clean_column(base_url),
     })
     # Drop rows missing any critical field
-    out = out.replace({"": pd.NA, "nan": pd.NA}).dropna(subset=["purchase_order", "product", "base_url"], how="any")
+    out = out.dropna(subset=["purchase_order", "product", "base_url"], how="any")
     return out
 
 
 def read_eans(path: Path) -> pd.DataFrame:
-    df = pd.read_excel(path, dtype=str)
+    df = pd.read_excel(path, dtype=str, engine=EXCEL_ENGINE)
     df = normalize_column_names(df)
     product = get_column(df, ["product", "product_code", "sku"], 0)
     ean = get_column(df, ["ean", "barcode"], 1)
     out = pd.DataFrame({
-        "product": product.astype(str).str.strip(),
-        "ean": ean.astype(str).str.strip(),
+        "product": _clean_column(product),
+        "ean": _clean_column(ean),
     })
-    out = out.replace({"": pd.NA, "nan": pd.NA}).dropna(subset=["product", "ean"], how="any")
+    out = out.dropna(subset=["product", "ean"], how="any")
     return out
 
 
@@ -91,28 +117,39 @@ def build_urls(orders: pd.DataFrame, eans: pd.DataFrame) -> Tuple[pd.DataFrame,
     Produce URLs for every matching (order, ean) where product codes match.
     Returns (urls_df, unmatched_orders_df)
     """
-    # Normalize product for joining: case-insensitive, strip
-    left = orders.copy()
-    right = eans.copy()
-    left["product_key"] = left["product"].str.strip().str.lower()
-    right["product_key"] = right["product"].str.strip().str.lower()
-
-    merged = left.merge(right[["product_key", "ean"]], on="product_key", how="left")
+    # Normalize product for joining: case-insensitive, strip. Keys are computed
+    # on the side and attached via assign so the inputs are never copied whole.
+    left_key = orders["product"].str.strip().str.lower()
+    right_key = eans["product"].str.strip().str.lower()
+
+    # Merge on a shared categorical so pandas hashes integer codes instead of
+    # Python strings. Skip the conversion when either side is empty: there is
+    # nothing to gain, and an empty key keeps a different dtype than the
+    # populated side, which union_categoricals rejects.
+    if not left_key.empty and not right_key.empty:
+        categories = pd.api.types.union_categoricals(
+            [left_key.astype("category"), right_key.astype("category")],
+            sort_categories=False,
+        ).categories
+        left_key = pd.Categorical(left_key, categories=categories)
+        right_key = pd.Categorical(right_key, categories=categories)
+
+    merged = orders.assign(product_key=left_key).merge(
+        eans.assign(product_key=right_key)[["product_key", "ean"]],
+        on="product_key",
+        how="left",
+    )
+    merged.drop(columns=["product_key"], inplace=True)
 
     matched = merged.dropna(subset=["ean"]).copy()
     unmatched = merged[merged["ean"].isna()][["purchase_order", "product", "base_url"]].drop_duplicates()
 
     # Compose URL: base_url (no trailing slash) + /01/ + ean + /10/ + purchase_order
-    def normalize_base(url: str) -> str:
-        return str(url).rstrip("/")
-
-    matched["base_url"] = matched["base_url"].map(normalize_base)
+    matched["base_url"] = matched["base_url"].str.rstrip("/")
     matched["url"] = (
-        matched["base_url"].astype(str)
-        + "/01/"
-        + matched["ean"].astype(str)
-        + "/10/"
-        + matched["purchase_order"].astype(str)
+        matched["base_url"]
+        .str.cat(matched["ean"], sep="/01/")
+        .str.cat(matched["purchase_order"], sep="/10/")
     )
 
     result = matched[["purchase_order", "product", "base_url", "ean", "url"]]
@@ -126,7 +163,7 @@ def process_pair(eans_path: Path, orders_path: Path, output_path: Path) -> None:
     urls_df, unmatched_df = build_urls(orders_df, eans_df)
 
     # Write to Excel with two sheets: urls (main) and unmatched_orders (if any)
-    with pd.ExcelWriter(output_path, engine="openpyxl") as writer:
+    with pd.ExcelWriter(output_path, **EXCEL_WRITER_KWARGS) as writer:
         urls_df.to_excel(writer, index=False, sheet_name="urls")
         if not unmatched_df.empty:
             unmatched_df.to_excel(writer, index=False, sheet_name="unmatched_orders")
@@ -141,14 +178,20 @@ def main(argv: List[str]) -> int:
         print("No matching *_eans.xlsx and *_orders.xlsx pairs found.")
         return 0
 
-    for eans_path, orders_path, base in pairs:
-        output_path = script_dir / f"{base}_urls.xlsx"
-        print(f"Processing pair: {eans_path.name} + {orders_path.name} -> {output_path.name}")
-        try:
-            process_pair(eans_path, orders_path, output_path)
-            print(f"Wrote: {output_path}")
-        except Exception as exc:  # Intentional broad catch to proceed with other pairs
-            print(f"Failed processing {base}: {exc}")
+    # Each pair is independent (reads + merge + write), so fan out across cores
+    with ProcessPoolExecutor() as executor:
+        futures = {}
+        for eans_path, orders_path, base in pairs:
+            output_path = script_dir / f"{base}_urls.xlsx"
+            print(f"Processing pair: {eans_path.name} + {orders_path.name} -> {output_path.name}")
+            futures[executor.submit(process_pair, eans_path, orders_path, output_path)] = (base, output_path)
+        for future in as_completed(futures):
+            base, output_path = futures[future]
+            try:
+                future.result()
+                print(f"Wrote: {output_path}")
+            except Exception as exc:  # Intentional broad catch to proceed with other pairs
+                print(f"Failed processing {base}: {exc}")
 
     return 0
 